@@ -1,10 +1,102 @@
 """
 Rental property financial analysis functions.
 """
+from functools import lru_cache
+
 import pandas as pd
 import numpy as np
 
 
+# Frames at least this large use the compiled kernel when numba is available
+NUMBA_MIN_ROWS = 10000
+
+# Columns cast to string / numeric / categorical by the normalizers
+ZILLOW_STR_COLS = ('ID', 'Address', 'Zipcode', 'LotSize')
+ZILLOW_NUM_COLS = ('Sqft', 'Price', 'PriceEstimate', 'RentEstimate')
+ZILLOW_CAT_COLS = ('Zipcode', 'HomeType')
+REDFIN_STR_COLS = ('ID', 'Address', 'Zipcode', 'Beds', 'Baths', 'LotSize')
+REDFIN_NUM_COLS = ('Sqft', 'Price', 'RentEstimate')
+REDFIN_CAT_COLS = ('Zipcode', 'Beds', 'Baths')
+
+
+@lru_cache(maxsize=None)
+def _cashflow_kernel():
+    """
+    Import the numba cash flow kernel on first use.
+
+    numba is slow to import, so it is only loaded once a frame is large
+    enough to use the kernel.
+
+    Returns:
+        cashflow_kernel, or None if numba is not installed
+    """
+    try:
+        from analysis_numba import cashflow_kernel
+    except ImportError:  # numba not installed, use the NumPy path
+        return None
+    return cashflow_kernel
+
+
+@lru_cache(maxsize=256)
+def _mortgage_factor(annual_rate, n):
+    """
+    Monthly payment per dollar borrowed (standard mortgage formula).
+
+    Cached so scenario sweeps over the same (rate, term) pairs reuse it.
+
+    Args:
+        annual_rate: Annual interest rate (e.g., 0.061 for 6.1%)
+        n: Loan term in months
+
+    Returns:
+        Monthly payment for a loan of 1 (1 / n for an interest-free loan)
+    """
+    r = annual_rate / 12
+    if r == 0:
+        return 1 / n
+    p = (1 + r) ** n
+    return r * p / (p - 1)
+
+
+def _cash_flow_arrays(price, rent, interest_rate, loan_months, monthly_insurance,
+                      down_payment_percent):
+    """
+    Compute monthly property tax, mortgage and cash flow, rounded to cents.
+
+    Args:
+        price: float64 array of purchase prices
+        rent: float64 array of monthly rent estimates
+        interest_rate: Annual interest rate
+        loan_months: Loan term in months
+        monthly_insurance: Monthly insurance cost
+        down_payment_percent: Down payment decimal, a scalar or one per property
+
+    Returns:
+        Tuple of float64 arrays (tax, mortgage, cashflow)
+    """
+    # Monthly payment per dollar borrowed
+    mortgage_factor = _mortgage_factor(interest_rate, loan_months)
+
+    cashflow_kernel = _cashflow_kernel() if len(price) >= NUMBA_MIN_ROWS else None
+
+    if cashflow_kernel is not None:
+        # Fused tax / mortgage / cash flow pass over the raw arrays
+        dp = np.broadcast_to(down_payment_percent, price.shape).astype(np.float64)
+
+        return cashflow_kernel(price, rent, mortgage_factor, monthly_insurance, dp)
+
+    # Calculate monthly property tax (assuming 1.25% annual property tax)
+    tax = np.round(price * 0.0125 / 12, 2)
+
+    # Calculate monthly mortgage payment on the amount financed (1 - down payment)
+    mortgage = np.round((1 - down_payment_percent) * price * mortgage_factor, 2)
+
+    # Calculate monthly cash flow
+    cash = np.round(rent - (tax + mortgage + monthly_insurance), 2)
+
+    return tax, mortgage, cash
+
+
 def calculate_monthly_cash_flow(df, interest_rate, loan_months=360,
                                 monthly_insurance=100, down_payment_percent=0.20):
     """
@@ -15,39 +107,35 @@ def calculate_monthly_cash_flow(df, interest_rate, loan_months=360,
         interest_rate: Annual interest rate (e.g., 0.061 for 6.1%)
         loan_months: Loan term in months (default: 360 for 30 years)
         monthly_insurance: Monthly insurance cost in dollars
-        down_payment_percent: Down payment as decimal (e.g., 0.20 for 20%)
+        down_payment_percent: Down payment as decimal (e.g., 0.20 for 20%).
+            A scalar applies to every property; an array or Series must have
+            one entry per row and is matched to df by position, not by index.
 
     Returns:
         DataFrame with cash flow calculations added
     """
-    df = df.copy()
-
-    # Convert annual rate to monthly
-    monthly_rate = interest_rate / 12
-
-    # Amount financed (1 - down payment)
-    loan_to_value = 1 - down_payment_percent
-
-    # Calculate monthly property tax (assuming 1.25% annual property tax)
-    df["PropertyTax"] = round((df["Price"] * 0.0125) / 12, 2)
-
-    # Calculate monthly mortgage payment using standard mortgage formula
-    df["MonthlyMortgage"] = round(
-        ((loan_to_value * df["Price"]) *
-         (monthly_rate * (1 + monthly_rate) ** loan_months)) /
-        (((1 + monthly_rate) ** loan_months) - 1),
-        2
+    if not np.isscalar(down_payment_percent):
+        down_payment_percent = np.asarray(down_payment_percent, dtype=float)
+        if len(down_payment_percent) != len(df):
+            raise ValueError(
+                f"down_payment_percent has {len(down_payment_percent)} values "
+                f"but df has {len(df)} rows"
+            )
+
+    # Work on raw arrays to skip Series index alignment
+    price = df["Price"].to_numpy(dtype=np.float64, na_value=np.nan)
+    rent = df["RentEstimate"].to_numpy(dtype=np.float64, na_value=np.nan)
+
+    tax, mortgage, cash = _cash_flow_arrays(
+        price, rent, interest_rate, loan_months, monthly_insurance, down_payment_percent
     )
 
-    # Calculate monthly cash flow
-    df["MonthlyCashFlow"] = round(
-        df["RentEstimate"] - (df["PropertyTax"] + df["MonthlyMortgage"] + monthly_insurance),
-        2
-    )
+    # Add all result columns in one step (df itself is left unchanged)
+    df = df.assign(PropertyTax=tax, MonthlyMortgage=mortgage, MonthlyCashFlow=cash)
 
-    # Sort by cash flow (best deals first)
-    df = df.sort_values(by=['MonthlyCashFlow'], ascending=False)
-    df = df.reset_index(drop=True)
+    # Sort by cash flow (best deals first, missing values last)
+    order = np.argsort(-cash, kind='stable')
+    df = df.iloc[order].reset_index(drop=True)
 
     return df
 
@@ -57,8 +145,12 @@ def calculate_break_even_down_payment(df, interest_rate, loan_months=360,
     """
     Calculate the minimum down payment percentage needed for positive cash flow.
 
+    The break-even loan is solved in closed form for every property at once,
+    then rounded up to the next whole percent (minimum 20%). Properties keep
+    their input order.
+
     Args:
-        df: DataFrame with property data (must have MonthlyCashFlow column)
+        df: DataFrame with property data (Price and RentEstimate columns)
         interest_rate: Annual interest rate
         loan_months: Loan term in months
         monthly_insurance: Monthly insurance cost
@@ -66,46 +158,85 @@ def calculate_break_even_down_payment(df, interest_rate, loan_months=360,
     Returns:
         DataFrame with down payment percentages and amounts
     """
-    result_df = pd.DataFrame()
-    down_payment_percentages = []
-
-    for idx, row in df.iterrows():
-        property_df = pd.DataFrame([row])
-
-        # If already profitable at 20% down
-        if row['MonthlyCashFlow'] > 0:
-            result_df = pd.concat([result_df, property_df], ignore_index=True)
-            down_payment_percentages.append(0.20)
-        else:
-            # Find minimum down payment for positive cash flow
-            found = False
-            for down_pct in np.arange(0.20, 1.0, 0.01):
-                test_df = calculate_monthly_cash_flow(
-                    property_df,
-                    interest_rate,
-                    loan_months,
-                    monthly_insurance,
-                    down_pct
-                )
-
-                if test_df['MonthlyCashFlow'].iloc[0] > 0:
-                    result_df = pd.concat([result_df, test_df], ignore_index=True)
-                    down_payment_percentages.append(round(down_pct, 2))
-                    found = True
-                    break
-
-            # If no viable down payment found, skip this property
-            if not found:
-                continue
-
-    # Add down payment info
-    result_df['DownPaymentPercent'] = down_payment_percentages
-    result_df['DownPaymentAmount'] = round(
-        result_df['DownPaymentPercent'] * result_df['Price'],
-        2
+    mortgage_factor = _mortgage_factor(interest_rate, loan_months)
+
+    price = df["Price"].to_numpy(dtype=np.float64, na_value=np.nan)
+    rent = df["RentEstimate"].to_numpy(dtype=np.float64, na_value=np.nan)
+    property_tax = price * 0.0125 / 12
+
+    # Rent left over for the mortgage. If it can't cover tax and insurance,
+    # even 100% down loses money, so skip those properties up front.
+    max_payment = rent - property_tax - monthly_insurance
+    feasible = max_payment > 0
+    df = df[feasible]
+    price = price[feasible]
+    rent = rent[feasible]
+
+    # Largest loan the rent can carry, solved from MonthlyCashFlow = 0
+    required_loan = max_payment[feasible] / mortgage_factor
+
+    # Smallest whole percent strictly above break-even, starting at 20% down
+    down_pct = (np.floor((1 - required_loan / price) * 100) + 1) / 100
+    down_pct = np.round(np.clip(down_pct, 0.20, 1.0), 2)
+
+    # The closed form ignores cent rounding, so a property can round to a
+    # cash flow of exactly zero. Move those up one percent at a time until
+    # the rounded cash flow is positive.
+    tax, mortgage, cash = _cash_flow_arrays(
+        price, rent, interest_rate, loan_months, monthly_insurance, down_pct
     )
+    short = np.flatnonzero((cash <= 0) & (down_pct < 1.0))
+    while short.size:
+        down_pct[short] = np.round(down_pct[short] + 0.01, 2)
+        short = short[down_pct[short] < 1.0]
+        tax[short], mortgage[short], cash[short] = _cash_flow_arrays(
+            price[short], rent[short], interest_rate, loan_months,
+            monthly_insurance, down_pct[short]
+        )
+        short = short[cash[short] <= 0]
+
+    # Properties that would need 100% down have no viable down payment
+    viable = down_pct < 1.0
+
+    return df[viable].reset_index(drop=True).assign(
+        PropertyTax=tax[viable],
+        MonthlyMortgage=mortgage[viable],
+        MonthlyCashFlow=cash[viable],
+        DownPaymentPercent=down_pct[viable],
+        DownPaymentAmount=np.round(down_pct[viable] * price[viable], 2)
+    )
+
 
-    return result_df
+def _set_dtypes(df, str_cols, num_cols, cat_cols=()):
+    """
+    Cast the available string, numeric and categorical columns.
+
+    Strings are stored in contiguous Arrow buffers rather than one Python
+    object per value. Numbers are stored as float32, which is ample for
+    prices, rents and square footage and halves their memory.
+
+    Categorical columns are applied last, so a column can be cleaned as a
+    string first.
+
+    Args:
+        df: DataFrame with normalized column names
+        str_cols: Columns to store as strings
+        num_cols: Columns to coerce to numbers (invalid values become NaN)
+        cat_cols: Columns with few distinct values to store as categoricals
+
+    Returns:
+        DataFrame with data types set
+    """
+    str_map = {col: 'string[pyarrow]' for col in str_cols if col in df.columns}
+    df = df.astype(str_map)
+
+    num_cols = [col for col in num_cols if col in df.columns]
+    df[num_cols] = df[num_cols].apply(pd.to_numeric, errors='coerce').astype(np.float32)
+
+    cat_map = {col: 'category' for col in cat_cols if col in df.columns}
+    df = df.astype(cat_map)
+
+    return df
 
 
 def normalize_zillow_data(df):
@@ -133,35 +264,22 @@ def normalize_zillow_data(df):
         'zpid': 'ID'
     }
 
-    df = df.rename(columns=column_mapping)
+    # Rename only the source columns the response actually contains
+    present = {src: dst for src, dst in column_mapping.items() if src in df.columns}
+    df = df.rename(columns=present)
 
     # Select relevant columns
     columns = ['ID', 'Address', 'Zipcode', 'Sqft', 'LotSize',
                'Price', 'PriceEstimate', 'RentEstimate', 'HomeType']
 
-    # Only keep columns that exist
-    available_columns = [col for col in columns if col in df.columns]
-    df = df[available_columns]
-
-    # Clean data
-    df = df.dropna(subset=['Price'])
+    # Only keep columns that exist (RentEstimate is always kept for the analysis)
+    available_columns = [col for col in columns if col in df.columns or col == 'RentEstimate']
+    df = df.reindex(columns=available_columns)
 
     # Set data types
-    if 'ID' in df.columns:
-        df['ID'] = df['ID'].astype(str)
-    if 'Address' in df.columns:
-        df['Address'] = df['Address'].astype(str)
-    if 'Zipcode' in df.columns:
-        df['Zipcode'] = df['Zipcode'].astype(str)
-    if 'LotSize' in df.columns:
-        df['LotSize'] = df['LotSize'].astype(str)
-    if 'Price' in df.columns:
-        df['Price'] = pd.to_numeric(df['Price'], errors='coerce')
-    if 'PriceEstimate' in df.columns:
-        df['PriceEstimate'] = pd.to_numeric(df['PriceEstimate'], errors='coerce')
-    if 'RentEstimate' in df.columns:
-        df['RentEstimate'] = pd.to_numeric(df['RentEstimate'], errors='coerce')
+    df = _set_dtypes(df, ZILLOW_STR_COLS, ZILLOW_NUM_COLS, ZILLOW_CAT_COLS)
 
+    # Drop listings without a usable price
     df = df.dropna(subset=['Price'])
 
     return df
@@ -188,31 +306,19 @@ def normalize_redfin_data(df):
         'lotSize.value': 'LotSize'
     }
 
-    df = df.rename(columns=column_mapping)
+    # Rename only the source columns the response actually contains
+    present = {src: dst for src, dst in column_mapping.items() if src in df.columns}
+    df = df.rename(columns=present)
 
-    columns = ['ID', 'Address', 'Zipcode', 'Beds', 'Baths', 'Sqft', 'LotSize', 'Price']
-    available_columns = [col for col in columns if col in df.columns]
-    df = df[available_columns]
-
-    # Clean data
-    df = df.dropna(subset=['Price'])
+    # Redfin has no rent estimate; RentEstimate is added empty for the analysis
+    columns = ['ID', 'Address', 'Zipcode', 'Beds', 'Baths', 'Sqft', 'LotSize', 'Price', 'RentEstimate']
+    available_columns = [col for col in columns if col in df.columns or col == 'RentEstimate']
+    df = df.reindex(columns=available_columns)
 
     # Set data types
-    if 'ID' in df.columns:
-        df['ID'] = df['ID'].astype(str)
-    if 'Address' in df.columns:
-        df['Address'] = df['Address'].astype(str)
-    if 'Zipcode' in df.columns:
-        df['Zipcode'] = df['Zipcode'].astype(str)
-    if 'Beds' in df.columns:
-        df['Beds'] = df['Beds'].astype(str)
-    if 'Baths' in df.columns:
-        df['Baths'] = df['Baths'].astype(str)
-    if 'LotSize' in df.columns:
-        df['LotSize'] = df['LotSize'].astype(str)
-    if 'Price' in df.columns:
-        df['Price'] = pd.to_numeric(df['Price'], errors='coerce')
+    df = _set_dtypes(df, REDFIN_STR_COLS, REDFIN_NUM_COLS, REDFIN_CAT_COLS)
 
+    # Drop listings without a usable price
     df = df.dropna(subset=['Price'])
 
     return df
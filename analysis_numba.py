@@ -0,0 +1,40 @@
+"""
+Numba-compiled kernels for the rental property analysis functions.
+
+This module requires numba. analysis.py imports it on first use for
+large frames and falls back to its NumPy implementation otherwise.
+"""
+import numpy as np
+from numba import njit, prange
+
+
+@njit(parallel=True, cache=True, error_model='numpy')
+def cashflow_kernel(price, rent, mortgage_factor, ins, dp):
+    """
+    Compute property tax, mortgage and cash flow in a single pass.
+
+    Values are rounded to cents exactly like numpy.round(x, 2), and cash
+    flow is taken from the rounded tax and mortgage amounts.
+
+    Args:
+        price: float64 array of purchase prices
+        rent: float64 array of monthly rent estimates
+        mortgage_factor: Monthly payment per dollar borrowed, from
+            analysis._mortgage_factor so both paths agree at every rate
+        ins: Monthly insurance cost
+        dp: float64 array of down payment decimals, one per property
+
+    Returns:
+        Tuple of float64 arrays (tax, mortgage, cashflow)
+    """
+    size = price.shape[0]
+    tax = np.empty(size, dtype=np.float64)
+    mortgage = np.empty(size, dtype=np.float64)
+    cashflow = np.empty(size, dtype=np.float64)
+
+    for i in prange(size):
+        tax[i] = np.rint(price[i] * 0.0125 / 12 * 100.0) / 100.0
+        mortgage[i] = np.rint((1.0 - dp[i]) * price[i] * mortgage_factor * 100.0) / 100.0
+        cashflow[i] = np.rint((rent[i] - (tax[i] + mortgage[i] + ins)) * 100.0) / 100.0
+
+    return tax, mortgage, cashflow
@@ -1,8 +1,24 @@
 """
 API functions for fetching real estate listing data from various sources.
 """
+import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+
 import requests
 import pandas as pd
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson not installed, use the standard library parser
+    json_loads = json.loads
+
+
+# (connect, read) timeout in seconds for every API request
+REQUEST_TIMEOUT = (3.05, 30)
 
 
 class RealEstateAPI:
@@ -12,6 +28,18 @@ class RealEstateAPI:
         self.scrapeak_key = scrapeak_key or 'c99d5365-e52d-4591-8805-5529e2cc28f9'
         self.rapidapi_key = rapidapi_key or '8c4d33ab1fmsh042342b8342f6f9p1a302djsnf9ae6918b4b9'
 
+        # Shared session so repeated calls reuse pooled keep-alive connections
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 502, 503, 504],
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry)
+        self._session = requests.Session()
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+
     def get_zillow_listings(self, listing_url):
         """
         Fetch Zillow listings using Scrapeak API.
@@ -30,15 +58,34 @@ class RealEstateAPI:
         }
 
         try:
-            response = requests.get(url, params=querystring)
+            response = self._session.get(url, params=querystring, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
-            data = response.json()
+            data = json_loads(response.content)
             df = pd.json_normalize(data["data"]["cat1"]["searchResults"]["mapResults"])
             return df
         except Exception as e:
             print(f"Error fetching Zillow listings: {e}")
             return pd.DataFrame()
 
+    def get_zillow_listings_batch(self, listing_urls, max_workers=8):
+        """
+        Fetch several Zillow searches concurrently using Scrapeak API.
+
+        Args:
+            listing_urls: Iterable of Zillow search URLs
+            max_workers: Maximum number of requests in flight at once
+
+        Returns:
+            Dict mapping each URL to its listing DataFrame, in input order
+        """
+        listing_urls = list(listing_urls)
+        if not listing_urls:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(self.get_zillow_listings, listing_urls)
+            return dict(zip(listing_urls, results))
+
     def get_zillow_by_working_api(self, listing_url, page_number=1):
         """
         Fetch Zillow listings using Working API (alternative method).
@@ -63,9 +110,9 @@ class RealEstateAPI:
         }
 
         try:
-            response = requests.get(url, headers=headers, params=querystring)
+            response = self._session.get(url, headers=headers, params=querystring, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
-            df = pd.json_normalize(response.json()['Results'])
+            df = pd.json_normalize(json_loads(response.content)['Results'])
             return df
         except Exception as e:
             print(f"Error fetching Zillow listings (Working API): {e}")
@@ -91,9 +138,9 @@ class RealEstateAPI:
         }
 
         try:
-            response = requests.get(url, headers=headers, params=querystring)
+            response = self._session.get(url, headers=headers, params=querystring, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
-            data = response.json()
+            data = json_loads(response.content)
 
             # Handle different response structures
             if 'homes' in data.get('data', {}):
@@ -129,7 +176,7 @@ class RealEstateAPI:
             "zpid": zpid
         }
 
-        return requests.get(url, params=querystring)
+        return self._session.get(url, params=querystring, timeout=REQUEST_TIMEOUT)
 
     def get_zpid_by_address(self, street, city, state, zip_code=None):
         """
@@ -154,16 +201,18 @@ class RealEstateAPI:
             "zip_code": zip_code
         }
 
-        return requests.get(url, params=querystring)
+        return self._session.get(url, params=querystring, timeout=REQUEST_TIMEOUT)
+
+
+@lru_cache(maxsize=None)
+def fresno_zillow_urls():
+    """
+    Predefined Zillow search URLs for Fresno, CA zip codes.
 
+    Loaded from data/fresno_zillow_urls.json on first use.
 
-# Predefined Zillow URLs for Fresno, CA zip codes
-FRESNO_ZILLOW_URLS = {
-    '93722': 'https://zillow.com/fresno-ca-93722/?searchQueryState=%7B%22isMapVisible%22%3Atrue%2C%22mapBounds%22%3A%7B%22north%22%3A36.871937850818554%2C%22south%22%3A36.73283815503686%2C%22east%22%3A-119.78077706005858%2C%22west%22%3A-119.9902039399414%7D%2C%22usersSearchTerm%22%3A%228153%20N%20Cedar%20Ave%20%23129%20Fresno%2C%20CA%2093720%22%2C%22filterState%22%3A%7B%22sort%22%3A%7B%22value%22%3A%22globalrelevanceex%22%7D%2C%22ah%22%3A%7B%22value%22%3Atrue%7D%2C%22tow%22%3A%7B%22value%22%3Afalse%7D%2C%22con%22%3A%7B%22value%22%3Afalse%7D%2C%22apco%22%3A%7B%22value%22%3Afalse%7D%2C%22land%22%3A%7B%22value%22%3Afalse%7D%2C%22manu%22%3A%7B%22value%22%3Afalse%7D%7D%2C%22isListVisible%22%3Atrue%2C%22mapZoom%22%3A12%2C%22regionSelection%22%3A%5B%7B%22regionId%22%3A97431%2C%22regionType%22%3A7%7D%5D%2C%22pagination%22%3A%7B%7D%7D',
-    '93720': 'https://www.zillow.com/fresno-ca-93720/?searchQueryState=%7B%22isMapVisible%22%3Atrue%2C%22mapBounds%22%3A%7B%22north%22%3A36.89889711124698%2C%22south%22%3A36.829403367399564%2C%22east%22%3A-119.71074728002928%2C%22west%22%3A-119.81546071997069%7D%2C%22usersSearchTerm%22%3A%228153%20N%20Cedar%20Ave%20%23129%20Fresno%2C%20CA%2093720%22%2C%22filterState%22%3A%7B%22sort%22%3A%7B%22value%22%3A%22globalrelevanceex%22%7D%2C%22ah%22%3A%7B%22value%22%3Atrue%7D%2C%22tow%22%3A%7B%22value%22%3Afalse%7D%2C%22con%22%3A%7B%22value%22%3Afalse%7D%2C%22apco%22%3A%7B%22value%22%3Afalse%7D%2C%22land%22%3A%7B%22value%22%3Afalse%7D%2C%22manu%22%3A%7B%22value%22%3Afalse%7D%7D%2C%22isListVisible%22%3Atrue%2C%22mapZoom%22%3A13%2C%22regionSelection%22%3A%5B%7B%22regionId%22%3A97429%2C%22regionType%22%3A7%7D%5D%2C%22pagination%22%3A%7B%7D%7D',
-    '93705': 'https://www.zillow.com/fresno-ca-93705/?searchQueryState=%7B%22isMapVisible%22%3Atrue%2C%22mapBounds%22%3A%7B%22north%22%3A36.82125687406157%2C%22south%22%3A36.75169254968076%2C%22east%22%3A-119.7745407800293%2C%22west%22%3A-119.8792542199707%7D%2C%22usersSearchTerm%22%3A%228153%20N%20Cedar%20Ave%20%23129%20Fresno%2C%20CA%2093720%22%2C%22filterState%22%3A%7B%22sort%22%3A%7B%22value%22%3A%22globalrelevanceex%22%7D%2C%22ah%22%3A%7B%22value%22%3Atrue%7D%2C%22tow%22%3A%7B%22value%22%3Afalse%7D%2C%22con%22%3A%7B%22value%22%3Afalse%7D%2C%22apco%22%3A%7B%22value%22%3Afalse%7D%2C%22land%22%3A%7B%22value%22%3Afalse%7D%2C%22manu%22%3A%7B%22value%22%3Afalse%7D%7D%2C%22isListVisible%22%3Atrue%2C%22mapZoom%22%3A13%2C%22regionSelection%22%3A%5B%7B%22regionId%22%3A97416%2C%22regionType%22%3A7%7D%5D%2C%22pagination%22%3A%7B%7D%7D',
-    '93711': 'https://www.zillow.com/fresno-ca-93711/?searchQueryState=%7B%22isMapVisible%22%3Atrue%2C%22mapBounds%22%3A%7B%22north%22%3A36.907976289605614%2C%22south%22%3A36.76894213918674%2C%22east%22%3A-119.7256510600586%2C%22west%22%3A-119.93507793994141%7D%2C%22usersSearchTerm%22%3A%228153%20N%20Cedar%20Ave%20%23129%20Fresno%2C%20CA%2093720%22%2C%22filterState%22%3A%7B%22sort%22%3A%7B%22value%22%3A%22globalrelevanceex%22%7D%2C%22ah%22%3A%7B%22value%22%3Atrue%7D%2C%22tow%22%3A%7B%22value%22%3Afalse%7D%2C%22con%22%3A%7B%22value%22%3Afalse%7D%2C%22apco%22%3A%7B%22value%22%3Afalse%7D%2C%22land%22%3A%7B%22value%22%3Afalse%7D%2C%22manu%22%3A%7B%22value%22%3Afalse%7D%7D%2C%22isListVisible%22%3Atrue%2C%22mapZoom%22%3A12%2C%22regionSelection%22%3A%5B%7B%22regionId%22%3A97422%2C%22regionType%22%3A7%7D%5D%2C%22pagination%22%3A%7B%7D%7D',
-    '93710': 'https://www.zillow.com/fresno-ca-93710/?searchQueryState=%7B%22isMapVisible%22%3Atrue%2C%22mapBounds%22%3A%7B%22north%22%3A36.85422044243024%2C%22south%22%3A36.784686068675306%2C%22east%22%3A-119.7099347800293%2C%22west%22%3A-119.8146482199707%7D%2C%22usersSearchTerm%22%3A%228153%20N%20Cedar%20Ave%20%23129%20Fresno%2C%20CA%2093720%22%2C%22filterState%22%3A%7B%22sort%22%3A%7B%22value%22%3A%22globalrelevanceex%22%7D%2C%22ah%22%3A%7B%22value%22%3Atrue%7D%2C%22tow%22%3A%7B%22value%22%3Afalse%7D%2C%22con%22%3A%7B%22value%22%3Afalse%7D%2C%22apco%22%3A%7B%22value%22%3Afalse%7D%2C%22land%22%3A%7B%22value%22%3Afalse%7D%2C%22manu%22%3A%7B%22value%22%3Afalse%7D%7D%2C%22isListVisible%22%3Atrue%2C%22mapZoom%22%3A13%2C%22regionSelection%22%3A%5B%7B%22regionId%22%3A97421%2C%22regionType%22%3A7%7D%5D%2C%22pagination%22%3A%7B%7D%7D',
-    '93728': 'https://www.zillow.com/fresno-ca-93728/?searchQueryState=%7B%22isMapVisible%22%3Atrue%2C%22mapBounds%22%3A%7B%22north%22%3A36.7908501819575%2C%22south%22%3A36.72125825056633%2C%22east%22%3A-119.76504978002929%2C%22west%22%3A-119.8697632199707%7D%2C%22usersSearchTerm%22%3A%228153%20N%20Cedar%20Ave%20%23129%20Fresno%2C%20CA%2093720%22%2C%22filterState%22%3A%7B%22sort%22%3A%7B%22value%22%3A%22globalrelevanceex%22%7D%2C%22ah%22%3A%7B%22value%22%3Atrue%7D%2C%22tow%22%3A%7B%22value%22%3Afalse%7D%2C%22con%22%3A%7B%22value%22%3Afalse%7D%2C%22apco%22%3A%7B%22value%22%3Afalse%7D%2C%22land%22%3A%7B%22value%22%3Afalse%7D%2C%22manu%22%3A%7B%22value%22%3Afalse%7D%7D%2C%22isListVisible%22%3Atrue%2C%22mapZoom%22%3A13%2C%22regionSelection%22%3A%5B%7B%22regionId%22%3A97436%2C%22regionType%22%3A7%7D%5D%2C%22pagination%22%3A%7B%7D%7D',
-    '93726': 'https://www.zillow.com/fresno-ca-93726/?searchQueryState=%7B%22isMapVisible%22%3Atrue%2C%22mapBounds%22%3A%7B%22north%22%3A36.82770809522596%2C%22south%22%3A36.7581496305962%2C%22east%22%3A-119.70796928002929%2C%22west%22%3A-119.8126827199707%7D%2C%22usersSearchTerm%22%3A%228153%20N%20Cedar%20Ave%20%23129%20Fresno%2C%20CA%2093720%22%2C%22filterState%22%3A%7B%22sort%22%3A%7B%22value%22%3A%22globalrelevanceex%22%7D%2C%22ah%22%3A%7B%22value%22%3Atrue%7D%2C%22tow%22%3A%7B%22value%22%3Afalse%7D%2C%22con%22%3A%7B%22value%22%3Afalse%7D%2C%22apco%22%3A%7B%22value%22%3Afalse%7D%2C%22land%22%3A%7B%22value%22%3Afalse%7D%2C%22manu%22%3A%7B%22value%22%3Afalse%7D%7D%2C%22isListVisible%22%3Atrue%2C%22mapZoom%22%3A13%2C%22regionSelection%22%3A%5B%7B%22regionId%22%3A97434%2C%22regionType%22%3A7%7D%5D%2C%22pagination%22%3A%7B%7D%7D',
-}
+    Returns:
+        Dict mapping zip code to Zillow search URL
+    """
+    path = Path(__file__).with_name('data') / 'fresno_zillow_urls.json'
+    return json.loads(path.read_text(encoding='utf-8'))
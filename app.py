@@ -4,7 +4,7 @@ Rental Property Analysis Tool - Streamlit UI with Investment Calculator
 import streamlit as st
 import pandas as pd
 import numpy as np
-from api_functions import RealEstateAPI, FRESNO_ZILLOW_URLS
+from api_functions import RealEstateAPI, fresno_zillow_urls
 from analysis import (
     calculate_monthly_cash_flow,
     calculate_break_even_down_payment,
@@ -12,6 +12,29 @@ from analysis import (
     normalize_redfin_data
 )
 
+try:
+    from numba import njit
+except ImportError:  # numba not installed, run the loan simulation as plain Python
+    njit = None
+
+try:
+    # Ahead-of-time compiled loan simulation, built by build_kernels.py
+    from proj_kernels import simulate_years as _simulate_years
+except ImportError:  # not built, JIT-compile the pure-Python loop instead
+    from projection_kernels import simulate_years as _simulate_years
+    if njit is not None:
+        _simulate_years = njit(cache=True)(_simulate_years)
+
+
+# Preset ZIP codes and repair areas offered by the sidebar widgets
+FRESNO_ZIP_KEYS = tuple(fresno_zillow_urls())
+ROOM_OPTIONS = (
+    "Kitchen", "Bathroom", "Bedroom", "Living Room",
+    "Dining Room", "Basement", "Attic", "Roof",
+    "HVAC", "Plumbing", "Electrical", "Exterior",
+    "Flooring", "Paint", "Landscaping", "Other"
+)
+
 
 # Page configuration
 st.set_page_config(
@@ -29,6 +52,7 @@ if 'repairs' not in st.session_state:
     st.session_state.repairs = []
 
 
+@st.cache_data(max_entries=64, show_spinner=False)
 def calculate_investment_projections(
     purchase_price, down_payment_pct, interest_rate, loan_years,
     monthly_insurance, annual_tax_rate, monthly_rent, vacancy_rate,
@@ -47,10 +71,9 @@ def calculate_investment_projections(
         closing_costs: One-time closing costs added to initial investment
         annual_balloon_payment: Extra lump sum payment at end of each year
 
-    Returns DataFrame with yearly metrics.
+    Returns DataFrame with yearly metrics. Results are cached per set of
+    inputs, so reruns with unchanged inputs skip the calculation.
     """
-    projections = []
-
     # Initial calculations
     down_payment = purchase_price * down_payment_pct
     loan_amount = purchase_price - down_payment
@@ -67,159 +90,159 @@ def calculate_investment_projections(
     else:  # Line of Credit - no fixed payment, just interest minimum
         monthly_mortgage = 0  # Will calculate interest dynamically
 
-    # Starting values
-    current_property_value = purchase_price
-    current_monthly_rent = monthly_rent
-    remaining_balance = loan_amount
-    total_cash_invested = down_payment + initial_repairs + closing_costs
-    cumulative_cash_flow = 0
-    cumulative_extra_principal = 0
-
-    for year in range(1, holding_years + 1):
-        # Calculate for this year
-        year_start_balance = remaining_balance
-
-        # Annual appreciation
-        if year > 1:
-            current_property_value *= (1 + annual_appreciation)
-            current_monthly_rent *= (1 + annual_rent_increase)
-
-        # Monthly calculations
-        monthly_property_tax = (current_property_value * annual_tax_rate) / 12
-        monthly_maintenance = (purchase_price * ongoing_maintenance_pct) / 12
-
-        # Effective rent (accounting for vacancy)
-        effective_monthly_rent = current_monthly_rent * (1 - vacancy_rate)
-
-        # Loan paydown for the year with extra principal payments
-        principal_paid = 0  # Regular principal only
-        interest_paid = 0
-        total_extra_principal_this_year = 0
-        temp_balance = year_start_balance
-
-        for month in range(12):
-            if temp_balance > 0:
-                # Calculate interest for this month
-                interest_payment = temp_balance * monthly_rate
-                interest_paid += interest_payment
-
-                if loan_type == "mortgage":
-                    # Standard mortgage - fixed payment
-                    principal_payment = monthly_mortgage - interest_payment
-                else:
-                    # Line of Credit - interest only, no automatic principal
-                    principal_payment = 0
-
-                # Extra principal from fixed monthly amount
-                extra_from_fixed = extra_payment_monthly
-
-                # Extra principal from cash flow percentage (applies to both mortgage and LOC)
-                extra_from_cashflow = 0
-                monthly_expenses_temp = (monthly_mortgage if loan_type == "mortgage" else interest_payment) + monthly_property_tax + monthly_insurance + monthly_maintenance
-                monthly_cash_flow_temp = effective_monthly_rent - monthly_expenses_temp
-                if monthly_cash_flow_temp > 0:
-                    extra_from_cashflow = monthly_cash_flow_temp * cashflow_to_principal_pct
-
-                # Total extra principal this month
-                total_extra = extra_from_fixed + extra_from_cashflow
-
-                # Don't pay more than remaining balance
-                total_extra = min(total_extra, temp_balance - principal_payment)
-                if total_extra < 0:
-                    total_extra = 0
-
-                # Update running totals - KEEP SEPARATE to avoid double-counting
-                principal_paid += principal_payment  # Only regular principal
-                total_extra_principal_this_year += total_extra  # Track extra separately
-                temp_balance -= (principal_payment + total_extra)
-
-                if temp_balance < 0:
-                    temp_balance = 0
-
-        # Apply annual balloon payment at year end
-        if annual_balloon_payment > 0 and temp_balance > 0:
-            balloon_applied = min(annual_balloon_payment, temp_balance)
-            temp_balance -= balloon_applied
-            total_extra_principal_this_year += balloon_applied  # Include balloon in extra principal
-
-        remaining_balance = temp_balance
-        cumulative_extra_principal += total_extra_principal_this_year
-
-        # Calculate monthly payment amount for display (what you actually paid on average)
-        if loan_type == "mortgage":
-            avg_monthly_loan_payment = monthly_mortgage
+    # Property value, rent and non-loan costs for each year. Appreciation
+    # starts in year 2; a running product over the starting value and the
+    # growth factors gives the same values as compounding year by year.
+    years = np.arange(1, holding_years + 1)
+    property_value = np.cumprod(
+        np.concatenate(([purchase_price], np.full(holding_years - 1, 1 + annual_appreciation)))
+    )
+    current_rent = np.cumprod(
+        np.concatenate(([monthly_rent], np.full(holding_years - 1, 1 + annual_rent_increase)))
+    )
+    monthly_property_tax = (property_value * annual_tax_rate) / 12
+    monthly_maintenance = (purchase_price * ongoing_maintenance_pct) / 12
+
+    # Effective rent (accounting for vacancy)
+    effective_monthly_rent = current_rent * (1 - vacancy_rate)
+
+    if loan_type == "mortgage" and cashflow_to_principal_pct == 0 and annual_balloon_payment == 0:
+        # Without cash flow feedback or balloon payments a mortgage has a
+        # closed-form schedule, so every month can be computed at once.
+        # Loan balance at each month boundary, paying the fixed mortgage plus
+        # the fixed extra principal every month until the loan is paid off
+        months = np.arange(holding_years * 12 + 1)
+        payment = monthly_mortgage + extra_payment_monthly
+        if monthly_rate > 0:
+            growth = (1 + monthly_rate) ** months
+            balances = loan_amount * growth - payment * (growth - 1) / monthly_rate
         else:
-            # For LOC, only show interest (extra principal shown separately)
-            avg_monthly_loan_payment = interest_paid / 12
+            balances = loan_amount - payment * months
+        # Anything under half a cent is rounding noise once the loan is paid off
+        balances = np.where(balances >= 0.005, balances, 0)
+
+        # Monthly interest, regular principal and extra principal
+        start_balances = balances[:-1]
+        active = start_balances > 0
+        interest = np.where(active, start_balances * monthly_rate, 0)
+        principal = np.where(active, monthly_mortgage - interest, 0)
+        extra = np.where(
+            active, np.clip(start_balances - principal, 0, extra_payment_monthly), 0
+        )
 
-        # Calculate total monthly expenses
-        if loan_type == "mortgage":
-            monthly_expenses = monthly_mortgage + monthly_property_tax + monthly_insurance + monthly_maintenance
-        else:
-            monthly_expenses = avg_monthly_loan_payment + monthly_property_tax + monthly_insurance + monthly_maintenance
-
-        # Calculate cash flow
-        # Monthly extra principal (for display purposes)
-        monthly_extra_principal = total_extra_principal_this_year / 12
-
-        # Gross monthly cash flow (before extra principal)
-        monthly_cash_flow_gross = effective_monthly_rent - monthly_expenses
-
-        # Net monthly cash flow (after extra principal)
-        monthly_cash_flow = monthly_cash_flow_gross - monthly_extra_principal
-
-        # Annual cash flow
-        annual_cash_flow = monthly_cash_flow * 12
-
-        # Equity
-        equity = current_property_value - remaining_balance
-
-        # Cumulative cash flow (what you actually receive)
-        cumulative_cash_flow += annual_cash_flow
-
-        # Total cash invested (including extra principal payments)
-        total_cash_invested_adjusted = total_cash_invested + cumulative_extra_principal
-
-        # ROI and Cash-on-Cash Return
-        total_return = cumulative_cash_flow + equity - total_cash_invested_adjusted
-        roi_pct = (total_return / total_cash_invested_adjusted * 100) if total_cash_invested_adjusted > 0 else 0
-        cash_on_cash = (annual_cash_flow / total_cash_invested * 100) if total_cash_invested > 0 else 0
-
-        # Net profit if sold today
-        selling_costs = current_property_value * 0.06  # 6% selling costs
-        net_proceeds = current_property_value - remaining_balance - selling_costs
-        total_profit = net_proceeds + cumulative_cash_flow - total_cash_invested_adjusted
-
-        # Interest saved by paying extra principal
-        # This is a simplified calculation - actual savings compound over time
-
-        projections.append({
-            'Year': year,
-            'PropertyValue': round(current_property_value, 2),
-            'MonthlyRent': round(current_monthly_rent, 2),
-            'MonthlyLoanPayment': round(avg_monthly_loan_payment, 2),
-            'MonthlyPropertyTax': round(monthly_property_tax, 2),
-            'MonthlyInsurance': round(monthly_insurance, 2),
-            'MonthlyInterest': round(interest_paid / 12, 2),
-            'MonthlyMaintenance': round(monthly_maintenance, 2),
-            'TotalMonthlyExpenses': round(avg_monthly_loan_payment + monthly_property_tax + monthly_insurance + monthly_maintenance, 2),
-            'MonthlyExtraPrincipal': round(monthly_extra_principal, 2),
-            'MonthlyCashFlow': round(monthly_cash_flow, 2),
-            'AnnualCashFlow': round(annual_cash_flow, 2),
-            'CumulativeCashFlow': round(cumulative_cash_flow, 2),
-            'LoanBalance': round(remaining_balance, 2),
-            'InterestPaidThisYear': round(interest_paid, 2),
-            'PrincipalPaid': round(principal_paid, 2),
-            'ExtraPrincipalThisYear': round(total_extra_principal_this_year, 2),
-            'CumulativeExtraPrincipal': round(cumulative_extra_principal, 2),
-            'Equity': round(equity, 2)
-            # 'CashOnCashReturn': round(cash_on_cash, 2),
-            # 'TotalROI': round(roi_pct, 2),
-            # 'NetProceedsIfSold': round(net_proceeds, 2),
-            # 'TotalProfit': round(total_profit, 2)
-        })
-
-    return pd.DataFrame(projections)
+        # Yearly totals and year-end balances
+        interest_paid = interest.reshape(holding_years, 12).sum(axis=1)
+        principal_paid = principal.reshape(holding_years, 12).sum(axis=1)
+        extra_principal = extra.reshape(holding_years, 12).sum(axis=1)
+        remaining_balance = balances[12::12]
+    else:
+        # Loan paydown month by month, with extra principal payments
+        cash_before_loan = effective_monthly_rent - (monthly_property_tax + monthly_insurance + monthly_maintenance)
+        remaining_balance, interest_paid, principal_paid, extra_principal = _simulate_years(
+            float(loan_amount), monthly_rate, float(monthly_mortgage), float(extra_payment_monthly),
+            float(cashflow_to_principal_pct), float(annual_balloon_payment), cash_before_loan,
+            loan_type == "mortgage"
+        )
+
+    # Calculate monthly payment amount for display (what you actually paid on average)
+    if loan_type == "mortgage":
+        avg_monthly_loan_payment = np.full(holding_years, monthly_mortgage)
+    else:
+        # For LOC, only show interest (extra principal shown separately)
+        avg_monthly_loan_payment = interest_paid / 12
+
+    # Calculate total monthly expenses
+    monthly_expenses = avg_monthly_loan_payment + monthly_property_tax + monthly_insurance + monthly_maintenance
+
+    # Monthly extra principal (for display purposes)
+    monthly_extra_principal = extra_principal / 12
+
+    # Gross monthly cash flow (before extra principal)
+    monthly_cash_flow_gross = effective_monthly_rent - monthly_expenses
+
+    # Net monthly cash flow (after extra principal)
+    monthly_cash_flow = monthly_cash_flow_gross - monthly_extra_principal
+
+    # Annual and cumulative cash flow (what you actually receive)
+    annual_cash_flow = monthly_cash_flow * 12
+    cumulative_cash_flow = np.cumsum(annual_cash_flow)
+
+    # Equity
+    equity = property_value - remaining_balance
+
+    # Running total of extra principal paid
+    cumulative_extra_principal = np.cumsum(extra_principal)
+
+    # Round every money column to cents in one pass (Year stays an integer)
+    return pd.DataFrame({
+        'Year': years,
+        'PropertyValue': property_value,
+        'MonthlyRent': current_rent,
+        'MonthlyLoanPayment': avg_monthly_loan_payment,
+        'MonthlyPropertyTax': monthly_property_tax,
+        'MonthlyInsurance': np.full(holding_years, monthly_insurance),
+        'MonthlyInterest': interest_paid / 12,
+        'MonthlyMaintenance': np.full(holding_years, monthly_maintenance),
+        'TotalMonthlyExpenses': monthly_expenses,
+        'MonthlyExtraPrincipal': monthly_extra_principal,
+        'MonthlyCashFlow': monthly_cash_flow,
+        'AnnualCashFlow': annual_cash_flow,
+        'CumulativeCashFlow': cumulative_cash_flow,
+        'LoanBalance': remaining_balance,
+        'InterestPaidThisYear': interest_paid,
+        'PrincipalPaid': principal_paid,
+        'ExtraPrincipalThisYear': extra_principal,
+        'CumulativeExtraPrincipal': cumulative_extra_principal,
+        'Equity': equity
+    }).round(2)
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _to_csv_bytes(df):
+    """Serialize a DataFrame to CSV bytes, cached by the frame's contents."""
+    return df.to_csv(index=False).encode()
+
+
+def _remove_repair(idx):
+    """Remove one repair from the repair list before the next rerun."""
+    st.session_state.repairs.pop(idx)
+
+
+def _clear_repairs():
+    """Empty the repair list before the next rerun."""
+    st.session_state.repairs = []
+
+
+@st.fragment
+def render_repair_list():
+    """
+    Render the repair list with remove buttons.
+
+    Runs as a fragment, so removing a repair only reruns the list instead of
+    the whole app.
+    """
+    if st.session_state.repairs:
+        st.markdown("#### Repair List")
+
+        # Display repairs with remove buttons
+        for idx, repair in enumerate(st.session_state.repairs):
+            col_room, col_desc, col_cost, col_remove = st.columns([2, 3, 2, 1])
+            with col_room:
+                st.text(repair['Room'])
+            with col_desc:
+                st.text(repair['Description'])
+            with col_cost:
+                st.text(f"${repair['Cost']:,.0f}")
+            with col_remove:
+                st.button("🗑️", key=f"remove_{idx}", help="Remove this repair",
+                          on_click=_remove_repair, args=(idx,))
+
+        total_repairs = sum(r['Cost'] for r in st.session_state.repairs)
+        st.metric("Total Repair Costs", f"${total_repairs:,.0f}")
+
+        st.button("🗑️ Clear All Repairs", on_click=_clear_repairs)
+    else:
+        st.info("No repairs added yet")
 
 
 def render_investment_calculator():
@@ -387,59 +410,30 @@ def render_investment_calculator():
         # Repair calculator
         st.markdown("#### Add Repairs")
 
-        repair_col1, repair_col2, repair_col3 = st.columns([2, 2, 1])
+        # Inputs are batched in a form, so typing doesn't rerun the app
+        with st.form("repair_form", clear_on_submit=True):
+            repair_col1, repair_col2, repair_col3 = st.columns([2, 2, 1])
 
-        with repair_col1:
-            room_options = [
-                "Kitchen", "Bathroom", "Bedroom", "Living Room",
-                "Dining Room", "Basement", "Attic", "Roof",
-                "HVAC", "Plumbing", "Electrical", "Exterior",
-                "Flooring", "Paint", "Landscaping", "Other"
-            ]
-            repair_room = st.selectbox("Room/Area", room_options, key="repair_room")
+            with repair_col1:
+                repair_room = st.selectbox("Room/Area", ROOM_OPTIONS, key="repair_room")
 
-        with repair_col2:
-            repair_description = st.text_input("Description", key="repair_desc", placeholder="e.g., New countertops")
+            with repair_col2:
+                repair_description = st.text_input("Description", key="repair_desc", placeholder="e.g., New countertops")
 
-        with repair_col3:
-            repair_cost = st.number_input("Cost ($)", min_value=0, value=0, step=100, key="repair_cost")
+            with repair_col3:
+                repair_cost = st.number_input("Cost ($)", min_value=0, value=0, step=100, key="repair_cost")
 
-        if st.button("➕ Add Repair"):
-            if repair_cost > 0:
-                st.session_state.repairs.append({
-                    'Room': repair_room,
-                    'Description': repair_description,
-                    'Cost': repair_cost
-                })
-                st.rerun()
+            if st.form_submit_button("➕ Add Repair"):
+                if repair_cost > 0:
+                    st.session_state.repairs.append({
+                        'Room': repair_room,
+                        'Description': repair_description,
+                        'Cost': repair_cost
+                    })
 
         # Display current repairs
-        if st.session_state.repairs:
-            st.markdown("#### Repair List")
-
-            # Display repairs with remove buttons
-            for idx, repair in enumerate(st.session_state.repairs):
-                col_room, col_desc, col_cost, col_remove = st.columns([2, 3, 2, 1])
-                with col_room:
-                    st.text(repair['Room'])
-                with col_desc:
-                    st.text(repair['Description'])
-                with col_cost:
-                    st.text(f"${repair['Cost']:,.0f}")
-                with col_remove:
-                    if st.button("🗑️", key=f"remove_{idx}", help="Remove this repair"):
-                        st.session_state.repairs.pop(idx)
-                        st.rerun()
-
-            total_repairs = sum([r['Cost'] for r in st.session_state.repairs])
-            st.metric("Total Repair Costs", f"${total_repairs:,.0f}")
-
-            if st.button("🗑️ Clear All Repairs"):
-                st.session_state.repairs = []
-                st.rerun()
-        else:
-            total_repairs = 0
-            st.info("No repairs added yet")
+        render_repair_list()
+        total_repairs = sum(r['Cost'] for r in st.session_state.repairs)
 
     # Calculate button
     st.markdown("---")
@@ -470,10 +464,13 @@ def render_investment_calculator():
         # Display summary metrics
         st.markdown("---")
         st.subheader("📈 Investment Summary")
-        final_year = projections_df.iloc[-1]
+        # Final-year values
+        final_property_value = projections_df['PropertyValue'].iat[-1]
+        final_monthly_rent = projections_df['MonthlyRent'].iat[-1]
+
         # Show extra principal impact if applicable
         if extra_payment_monthly > 0 or cashflow_to_principal_pct > 0:
-            total_extra_principal = final_year['CumulativeExtraPrincipal']
+            total_extra_principal = projections_df['CumulativeExtraPrincipal'].iat[-1]
             st.info(f"💰 Extra Principal Payments: ${total_extra_principal:,.0f} over {holding_years} years - This accelerated your loan payoff and built ${total_extra_principal:,.0f} in additional equity!")
 
         # Key metrics at the top
@@ -481,96 +478,98 @@ def render_investment_calculator():
 
         down_payment_amount = purchase_price * down_payment_pct
         total_invested = down_payment_amount + total_repairs + closing_costs
-        final_year = projections_df.iloc[-1]
 
         with metric_col1:
             st.metric("Total Cash Invested", f"${total_invested:,.0f}")
         with metric_col2:
             st.metric(
                 f"Year {holding_years} Property Value",
-                f"${final_year['PropertyValue']:,.0f}",
-                delta=f"+${final_year['PropertyValue'] - purchase_price:,.0f}"
+                f"${final_property_value:,.0f}",
+                delta=f"+${final_property_value - purchase_price:,.0f}"
             )
         # with metric_col3:
         #     st.metric(
         #         "Total Profit (if sold)",
-        #         f"${final_year['TotalProfit']:,.0f}",
-        #         delta=f"{final_year['TotalROI']:.1f}% ROI"
+        #         f"${projections_df['TotalProfit'].iat[-1]:,.0f}",
+        #         delta=f"{projections_df['TotalROI'].iat[-1]:.1f}% ROI"
         #     )
         with metric_col4:
             st.metric(
                 f"Year {holding_years} Monthly Rent",
-                f"${final_year['MonthlyRent']:,.0f}",
-                delta=f"+${final_year['MonthlyRent'] - monthly_rent:,.0f}"
+                f"${final_monthly_rent:,.0f}",
+                delta=f"+${final_monthly_rent - monthly_rent:,.0f}"
             )
 
         # Year-by-year projection table
         st.markdown("---")
         st.subheader("📅 Year-by-Year Projections")
 
-        # Format the dataframe for display
-        display_df = projections_df.copy()
-        display_df['PropertyValue'] = display_df['PropertyValue'].apply(lambda x: f"${x:,.0f}")
-        display_df['MonthlyRent'] = display_df['MonthlyRent'].apply(lambda x: f"${x:,.0f}")
-        display_df['MonthlyLoanPayment'] = display_df['MonthlyLoanPayment'].apply(lambda x: f"${x:,.0f}")
-        display_df['MonthlyPropertyTax'] = display_df['MonthlyPropertyTax'].apply(lambda x: f"${x:,.0f}")
-        display_df['MonthlyInterest'] = display_df['MonthlyInterest'].apply(lambda x: f"${x:,.0f}")
-        display_df['MonthlyInsurance'] = display_df['MonthlyInsurance'].apply(lambda x: f"${x:,.0f}")
-        display_df['MonthlyMaintenance'] = display_df['MonthlyMaintenance'].apply(lambda x: f"${x:,.0f}")
-        display_df['TotalMonthlyExpenses'] = display_df['TotalMonthlyExpenses'].apply(lambda x: f"${x:,.0f}")
-        display_df['MonthlyExtraPrincipal'] = display_df['MonthlyExtraPrincipal'].apply(lambda x: f"${x:,.0f}")
-        display_df['MonthlyCashFlow'] = display_df['MonthlyCashFlow'].apply(lambda x: f"${x:,.0f}")
-        display_df['AnnualCashFlow'] = display_df['AnnualCashFlow'].apply(lambda x: f"${x:,.0f}")
-        display_df['CumulativeCashFlow'] = display_df['CumulativeCashFlow'].apply(lambda x: f"${x:,.0f}")
-        display_df['LoanBalance'] = display_df['LoanBalance'].apply(lambda x: f"${x:,.0f}")
-        display_df['InterestPaidThisYear'] = display_df['InterestPaidThisYear'].apply(lambda x: f"${x:,.0f}")
-        display_df['PrincipalPaid'] = display_df['PrincipalPaid'].apply(lambda x: f"${x:,.0f}")
-        display_df['ExtraPrincipalThisYear'] = display_df['ExtraPrincipalThisYear'].apply(lambda x: f"${x:,.0f}")
-        display_df['CumulativeExtraPrincipal'] = display_df['CumulativeExtraPrincipal'].apply(lambda x: f"${x:,.0f}")
-        display_df['Equity'] = display_df['Equity'].apply(lambda x: f"${x:,.0f}")
-        # display_df['CashOnCashReturn'] = display_df['CashOnCashReturn'].apply(lambda x: f"{x:.2f}%")
-        # display_df['TotalROI'] = display_df['TotalROI'].apply(lambda x: f"{x:.2f}%")
-        # display_df['TotalProfit'] = display_df['TotalProfit'].apply(lambda x: f"${x:,.0f}")
-
-        st.dataframe(display_df, use_container_width=True, hide_index=True)
+        # Format the dataframe for display (the numbers themselves are left unchanged)
+        money_format = "${:,.0f}"
+        display_formats = {
+            'PropertyValue': money_format,
+            'MonthlyRent': money_format,
+            'MonthlyLoanPayment': money_format,
+            'MonthlyPropertyTax': money_format,
+            'MonthlyInterest': money_format,
+            'MonthlyInsurance': money_format,
+            'MonthlyMaintenance': money_format,
+            'TotalMonthlyExpenses': money_format,
+            'MonthlyExtraPrincipal': money_format,
+            'MonthlyCashFlow': money_format,
+            'AnnualCashFlow': money_format,
+            'CumulativeCashFlow': money_format,
+            'LoanBalance': money_format,
+            'InterestPaidThisYear': money_format,
+            'PrincipalPaid': money_format,
+            'ExtraPrincipalThisYear': money_format,
+            'CumulativeExtraPrincipal': money_format,
+            'Equity': money_format
+            # 'CashOnCashReturn': "{:.2f}%",
+            # 'TotalROI': "{:.2f}%",
+            # 'TotalProfit': money_format
+        }
+
+        st.dataframe(
+            projections_df.style.format(display_formats),
+            use_container_width=True,
+            hide_index=True
+        )
 
         # Charts
         st.markdown("---")
         st.subheader("📊 Visual Projections")
 
-        chart_tab1, chart_tab2, chart_tab3, chart_tab4 = st.tabs([
+        # Index by year once; each chart selects its columns from this frame
+        plot_df = projections_df.set_index('Year')
+
+        chart_tab1, chart_tab2, chart_tab3 = st.tabs([
             "Property Value & Equity",
             "Cash Flow",
-            "Loan Paydown",
-            "ROI Metrics"
+            "Loan Paydown"
         ])
 
         with chart_tab1:
             st.markdown("#### Property Value vs Equity Growth")
-            chart_data = projections_df[['Year', 'PropertyValue', 'Equity', 'LoanBalance']].set_index('Year')
+            chart_data = plot_df[['PropertyValue', 'Equity', 'LoanBalance']]
             st.line_chart(chart_data)
 
         with chart_tab2:
             st.markdown("#### Cash Flow Projections")
-            chart_data = projections_df[['Year', 'MonthlyCashFlow', 'AnnualCashFlow', 'CumulativeCashFlow']].set_index('Year')
+            chart_data = plot_df[['MonthlyCashFlow', 'AnnualCashFlow', 'CumulativeCashFlow']]
             st.line_chart(chart_data)
 
         with chart_tab3:
             st.markdown("#### Loan Balance Reduction")
-            chart_data = projections_df[['Year', 'LoanBalance']].set_index('Year')
+            chart_data = plot_df[['LoanBalance']]
             st.area_chart(chart_data)
 
-        with chart_tab4:
-            st.markdown("#### Return on Investment")
-            chart_data = projections_df[['Year', 'CashOnCashReturn', 'TotalROI']].set_index('Year')
-            st.line_chart(chart_data)
-
         # Download options
         st.markdown("---")
         col1, col2 = st.columns(2)
 
         with col1:
-            csv = projections_df.to_csv(index=False)
+            csv = _to_csv_bytes(projections_df)
             st.download_button(
                 label="📥 Download Projections (CSV)",
                 data=csv,
@@ -580,7 +579,7 @@ def render_investment_calculator():
 
         with col2:
             if st.session_state.repairs:
-                repairs_csv = pd.DataFrame(st.session_state.repairs).to_csv(index=False)
+                repairs_csv = _to_csv_bytes(pd.DataFrame(st.session_state.repairs))
                 st.download_button(
                     label="📥 Download Repairs List (CSV)",
                     data=repairs_csv,
@@ -589,6 +588,43 @@ def render_investment_calculator():
                 )
 
 
+@st.cache_resource
+def get_api():
+    """Return the shared API client, so its HTTP session is reused across reruns."""
+    return RealEstateAPI()
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def fetch_listings(data_source, listing_url):
+    """
+    Fetch and normalize listings for a URL.
+
+    Results are cached for an hour per (data_source, listing_url), so
+    fetching the same listing again is served from memory.
+
+    Args:
+        data_source: "Zillow (Scrapeak)", "Zillow (Working API)" or "Redfin"
+        listing_url: Zillow or Redfin search URL
+
+    Returns:
+        Normalized DataFrame of listings
+    """
+    api = get_api()
+
+    # Fetch data based on source
+    if data_source == "Zillow (Scrapeak)":
+        df = api.get_zillow_listings(listing_url)
+        df = normalize_zillow_data(df)
+    elif data_source == "Zillow (Working API)":
+        df = api.get_zillow_by_working_api(listing_url)
+        df = normalize_zillow_data(df)
+    else:  # Redfin
+        df = api.get_redfin_listings(listing_url)
+        df = normalize_redfin_data(df)
+
+    return df
+
+
 def main():
     st.title("🏠 Rental Property Investment Analyzer")
     st.markdown("Analyze potential rental properties and calculate cash flow projections")
@@ -613,9 +649,9 @@ def main():
             if use_preset:
                 selected_zip = st.selectbox(
                     "Select ZIP Code",
-                    list(FRESNO_ZILLOW_URLS.keys())
+                    FRESNO_ZIP_KEYS
                 )
-                listing_url = FRESNO_ZILLOW_URLS[selected_zip]
+                listing_url = fresno_zillow_urls()[selected_zip]
                 st.text_input("URL", value=listing_url, disabled=True, key="preset_url")
             else:
                 listing_url = st.text_input(
@@ -682,28 +718,14 @@ def main():
     if fetch_button and listing_url:
         with st.spinner("Fetching property listings..."):
             try:
-                api = RealEstateAPI()
-
-                # Fetch data based on source
-                if data_source == "Zillow (Scrapeak)":
-                    df = api.get_zillow_listings(listing_url)
-                    df = normalize_zillow_data(df)
-                elif data_source == "Zillow (Working API)":
-                    df = api.get_zillow_by_working_api(listing_url)
-                    df = normalize_zillow_data(df)
-                else:  # Redfin
-                    df = api.get_redfin_listings(listing_url)
-                    df = normalize_redfin_data(df)
+                df = fetch_listings(data_source, listing_url)
 
                 if df.empty:
                     st.error("No listings found. Please check the URL and try again.")
                     return
 
-                # Fill missing rent estimates
-                if 'RentEstimate' in df.columns:
-                    df['RentEstimate'] = df['RentEstimate'].fillna(default_rent)
-                else:
-                    df['RentEstimate'] = default_rent
+                # Fill missing rent estimates (the normalizers always provide the column)
+                df['RentEstimate'] = df['RentEstimate'].fillna(default_rent)
 
                 st.session_state.listings_data = df
                 st.success(f"✅ Fetched {len(df)} properties")
@@ -740,7 +762,7 @@ def main():
                 st.metric("Avg Price", f"${df['Price'].mean():,.0f}")
             with col3:
                 if 'Sqft' in df.columns:
-                    avg_sqft = df['Sqft'].replace('', np.nan).astype(float).mean()
+                    avg_sqft = pd.to_numeric(df['Sqft'], errors='coerce').mean()
                     st.metric("Avg Sqft", f"{avg_sqft:,.0f}" if not pd.isna(avg_sqft) else "N/A")
             with col4:
                 st.metric("Avg Rent Est.", f"${df['RentEstimate'].mean():,.0f}")
@@ -771,33 +793,38 @@ def main():
                     hide_index=True
                 )
 
-                # Metrics
+                # Metrics, reduced from one read of the cash flow column
+                cash_flow = analysis_df['MonthlyCashFlow'].to_numpy(dtype=np.float64)
+                positive_cf = int((cash_flow > 0).sum())
+                avg_cf = np.nanmean(cash_flow)
+                best_cf = np.nanmax(cash_flow)
+
                 col1, col2, col3 = st.columns(3)
                 with col1:
-                    positive_cf = len(analysis_df[analysis_df['MonthlyCashFlow'] > 0])
                     st.metric("Positive Cash Flow", f"{positive_cf} properties")
                 with col2:
-                    avg_cf = analysis_df['MonthlyCashFlow'].mean()
                     st.metric("Avg Monthly Cash Flow", f"${avg_cf:,.2f}")
                 with col3:
-                    best_cf = analysis_df['MonthlyCashFlow'].max()
                     st.metric("Best Cash Flow", f"${best_cf:,.2f}")
 
                 # Show best deals
                 st.subheader("🌟 Top 5 Best Deals")
-                top_5 = analysis_df.head(5)
-
-                for idx, row in top_5.iterrows():
-                    with st.expander(f"#{idx + 1}: {row.get('Address', 'N/A')} - ${row['MonthlyCashFlow']:,.2f}/mo"):
-                        col1, col2 = st.columns(2)
-                        with col1:
-                            st.write(f"**Price:** ${row['Price']:,.0f}")
-                            st.write(f"**Monthly Rent:** ${row['RentEstimate']:,.0f}")
-                            st.write(f"**Monthly Mortgage:** ${row['MonthlyMortgage']:,.2f}")
-                        with col2:
-                            st.write(f"**Property Tax:** ${row['PropertyTax']:,.2f}")
-                            st.write(f"**Insurance:** ${monthly_insurance:,.2f}")
-                            st.write(f"**Cash Flow:** ${row['MonthlyCashFlow']:,.2f}")
+                top_5 = analysis_df.nlargest(5, 'MonthlyCashFlow').reset_index(drop=True)
+
+                for idx, row in enumerate(top_5.itertuples(index=False)):
+                    with st.expander(f"#{idx + 1}: {getattr(row, 'Address', 'N/A')} - ${row.MonthlyCashFlow:,.2f}/mo"):
+                        st.table(pd.DataFrame({
+                            'Metric': ['Price', 'Monthly Rent', 'Monthly Mortgage',
+                                       'Property Tax', 'Insurance', 'Cash Flow'],
+                            'Value': [
+                                f"${row.Price:,.0f}",
+                                f"${row.RentEstimate:,.0f}",
+                                f"${row.MonthlyMortgage:,.2f}",
+                                f"${row.PropertyTax:,.2f}",
+                                f"${monthly_insurance:,.2f}",
+                                f"${row.MonthlyCashFlow:,.2f}"
+                            ]
+                        }).set_index('Metric'))
 
                 # Download option
                 csv = analysis_df.to_csv(index=False)
@@ -835,16 +862,18 @@ def main():
                                 hide_index=True
                             )
 
-                            # Summary
+                            # Summary, reduced from one read of the down payment column
+                            down_pct = breakeven_df['DownPaymentPercent'].to_numpy(dtype=np.float64)
+                            viable = len(down_pct)
+                            avg_down = down_pct.mean() * 100
+                            at_20 = int((down_pct <= 0.20).sum())
+
                             col1, col2, col3 = st.columns(3)
                             with col1:
-                                viable = len(breakeven_df)
                                 st.metric("Viable Properties", viable)
                             with col2:
-                                avg_down = breakeven_df['DownPaymentPercent'].mean() * 100
                                 st.metric("Avg Down Payment", f"{avg_down:.1f}%")
                             with col3:
-                                at_20 = len(breakeven_df[breakeven_df['DownPaymentPercent'] <= 0.20])
                                 st.metric("Profitable at 20%", at_20)
 
                             # Download
@@ -0,0 +1,33 @@
+"""
+Ahead-of-time compile the loan paydown simulation with numba.pycc.
+
+Run once at build/deploy time:
+
+    python build_kernels.py
+
+This writes the proj_kernels extension module next to app.py. app.py
+imports it when present, which skips numba's JIT compile and cache load on
+the first calculation; otherwise it falls back to JIT-compiling
+projection_kernels.simulate_years.
+"""
+import os
+
+from numba.pycc import CC
+
+from projection_kernels import simulate_years
+
+
+cc = CC('proj_kernels')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+# (loan_amount, monthly_rate, monthly_mortgage, extra_payment_monthly,
+#  cashflow_to_principal_pct, annual_balloon_payment, cash_before_loan,
+#  is_mortgage) -> (balance, interest, principal, extra) per year
+cc.export(
+    'simulate_years',
+    'UniTuple(f8[:], 4)(f8, f8, f8, f8, f8, f8, f8[:], b1)'
+)(simulate_years)
+
+
+if __name__ == '__main__':
+    cc.compile()
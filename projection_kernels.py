@@ -0,0 +1,97 @@
+"""
+Loan paydown simulation used by the investment calculator.
+
+Kept free of Streamlit so build_kernels.py can import and AoT-compile it.
+"""
+import numpy as np
+
+
+def simulate_years(loan_amount, monthly_rate, monthly_mortgage, extra_payment_monthly,
+                   cashflow_to_principal_pct, annual_balloon_payment, cash_before_loan,
+                   is_mortgage):
+    """
+    Run the month-by-month loan paydown for every projection year.
+
+    Pure numeric loop so it can be JIT-compiled with numba, or compiled
+    ahead of time by build_kernels.py.
+
+    Args:
+        loan_amount: Starting loan balance
+        monthly_rate: Monthly interest rate
+        monthly_mortgage: Fixed monthly payment (0 for a line of credit)
+        extra_payment_monthly: Fixed extra monthly payment to principal
+        cashflow_to_principal_pct: Share of positive cash flow paid to principal (0-1)
+        annual_balloon_payment: Extra lump sum paid at the end of each year
+        cash_before_loan: Array of monthly rent left after tax, insurance and
+            maintenance, one entry per year
+        is_mortgage: True for a standard mortgage, False for a line of credit
+
+    Returns:
+        Tuple of per-year arrays (year-end balance, interest paid, regular
+        principal paid, extra principal paid including balloon payments)
+    """
+    holding_years = cash_before_loan.shape[0]
+    balance_by_year = np.empty(holding_years)
+    interest_by_year = np.empty(holding_years)
+    principal_by_year = np.empty(holding_years)
+    extra_by_year = np.empty(holding_years)
+
+    temp_balance = loan_amount
+    for year in range(holding_years):
+        principal_paid = 0.0
+        interest_paid = 0.0
+        total_extra_principal_this_year = 0.0
+
+        # Extra principal from cash flow percentage (applies to both mortgage and LOC).
+        # A mortgage payment is fixed, so its extra principal is the same every
+        # month of the year; a line of credit depends on the month's interest.
+        year_cash_before_loan = cash_before_loan[year]
+        base_extra = extra_payment_monthly
+        if is_mortgage:
+            year_cash_flow = year_cash_before_loan - monthly_mortgage
+            if year_cash_flow > 0:
+                base_extra = extra_payment_monthly + year_cash_flow * cashflow_to_principal_pct
+
+        for month in range(12):
+            if temp_balance > 0:
+                # Calculate interest for this month
+                interest_payment = temp_balance * monthly_rate
+                interest_paid += interest_payment
+
+                if is_mortgage:
+                    # Standard mortgage - fixed payment
+                    principal_payment = monthly_mortgage - interest_payment
+                    month_extra = base_extra
+                else:
+                    # Line of Credit - interest only, no automatic principal
+                    principal_payment = 0.0
+                    month_extra = base_extra
+                    monthly_cash_flow_temp = year_cash_before_loan - interest_payment
+                    if monthly_cash_flow_temp > 0:
+                        month_extra = base_extra + monthly_cash_flow_temp * cashflow_to_principal_pct
+
+                # Total extra principal this month, never more than the remaining balance
+                total_extra = min(month_extra, temp_balance - principal_payment)
+                if total_extra < 0:
+                    total_extra = 0.0
+
+                # Update running totals - KEEP SEPARATE to avoid double-counting
+                principal_paid += principal_payment
+                total_extra_principal_this_year += total_extra
+                temp_balance -= (principal_payment + total_extra)
+
+                if temp_balance < 0:
+                    temp_balance = 0.0
+
+        # Apply annual balloon payment at year end
+        if annual_balloon_payment > 0 and temp_balance > 0:
+            balloon_applied = min(annual_balloon_payment, temp_balance)
+            temp_balance -= balloon_applied
+            total_extra_principal_this_year += balloon_applied  # Include balloon in extra principal
+
+        balance_by_year[year] = temp_balance
+        interest_by_year[year] = interest_paid
+        principal_by_year[year] = principal_paid
+        extra_by_year[year] = total_extra_principal_this_year
+
+    return balance_by_year, interest_by_year, principal_by_year, extra_by_year